@@ -7,58 +7,166 @@ handling, and validation checks. Each function is designed to be
 run as part of the clean_pipeline() at the bottom of this module.
 """
 
+import logging
+import os
+import re
 import pandas as pd
 import numpy as np
-import re
 from datetime import datetime
 
+# pyarrow is only needed to write the chunked Parquet output
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+
+logger = logging.getLogger(__name__)
+
+# lookup tables shared by the cleaning steps, built once at import time
+EMAIL_REGEX = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+EMAIL_PATTERN = re.compile(EMAIL_REGEX)
+
+DUPLICATE_NOTES = ["DUPLICATE_ENTRY_ERROR", "RESUBMISSION"]
+
+GENDER_MAP = {
+    "M": "Male",
+    "F": "Female",
+}
+GENDER_CATEGORIES = ["Male", "Female"]
+
+CORE_FIELDS = [
+    "full_name", "email", "ssn", "ip_address", "gender",
+    "date_of_birth", "zip_code", "annual_income",
+    "credit_history_months", "debt_to_income", "savings_balance",
+    "loan_approved"
+]
 
-def remove_duplicates(df: pd.DataFrame) -> pd.DataFrame:
+# fixed column dtypes for the chunked Parquet output; per-chunk dtypes can
+# differ (downcast widths, categories, columns missing from a chunk), but
+# every row group written to one file has to share a schema
+PARQUET_DTYPES = {
+    "app_id": "string",
+    "full_name": "string",
+    "email": "string",
+    "ssn": "string",
+    "ip_address": "string",
+    "gender": "string",
+    "date_of_birth": "datetime64[us]",
+    "zip_code": "string",
+    "annual_income": "float32",
+    "credit_history_months": "float32",
+    "debt_to_income": "float32",
+    "savings_balance": "float32",
+    "spending_total": "float64",
+    "spending_categories": "int64",
+    "spending_category_list": "string",
+    "loan_approved": "boolean",
+    "interest_rate": "float64",
+    "approved_amount": "float64",
+    "rejection_reason": "string",
+    "processing_timestamp": "string",
+    "loan_purpose": "string",
+    "notes": "string",
+}
+
+
+def remove_duplicates(
+    df: pd.DataFrame, verbose: bool = False, seen_ids: set | None = None
+) -> pd.DataFrame:
     """
     Remove duplicate records based on app_id.
     
     Strategy: first drop rows whose 'notes' field indicates they are
     a known duplicate or resubmission, then fall back to keeping the
     first occurrence of any remaining ID duplicates.
-    """
-    before = len(df)
     
-    # drop rows where notes indicate they are duplicates
-    mask = df["notes"].isin(["DUPLICATE_ENTRY_ERROR", "RESUBMISSION"])
-    df = df[~mask].copy()
+    When the data is processed in chunks, pass the same seen_ids set for
+    every chunk: IDs already kept in an earlier chunk are dropped, and the
+    IDs kept here are added to it.
+    """
+    # drop rows where notes indicate they are duplicates; compare on
+    # the categorical codes (int8 for a handful of categories) so this
+    # is a scan over a compact integer buffer
+    notes = df["notes"].astype("category")
+    codes = notes.cat.codes.to_numpy()
+    dup_codes = np.array(
+        [notes.cat.categories.get_loc(note) for note in DUPLICATE_NOTES if note in notes.cat.categories],
+        dtype=codes.dtype,
+    )
+    keep = ~np.isin(codes, dup_codes)
     
     # safety net: if there are still any ID duplicates, keep the first
-    df = df.drop_duplicates(subset=["app_id"], keep="first")
+    keep[keep] = ~df["app_id"][keep].duplicated(keep="first").to_numpy()
+    if seen_ids is not None:
+        keep[keep] = ~df["app_id"][keep].isin(seen_ids).to_numpy()
+        seen_ids.update(df["app_id"][keep])
     
-    after = len(df)
-    print(f"Removed {before - after} duplicate records ({before} -> {after})")
+    # a single slice, so the frame is only copied once
+    df = df.loc[keep]
+    
+    if verbose:
+        before, after = len(keep), len(df)
+        logger.info("Removed %d duplicate records (%d -> %d)", before - after, before, after)
     return df
 
 
-def standardize_gender(df: pd.DataFrame) -> pd.DataFrame:
+def standardize_gender(df: pd.DataFrame, verbose: bool = False) -> pd.DataFrame:
     """
     Standardize gender values to a consistent format.
     
     Maps abbreviated and full-length labels to 'Male'/'Female',
-    and treats empty strings or None as NaN.
+    and treats empty strings or None as NaN. The result is stored as
+    a categorical so the column costs one code per row.
     """
-    gender_map = {
-        "Male": "Male",
-        "M": "Male",
-        "Female": "Female",
-        "F": "Female",
-        "": np.nan,
-        None: np.nan,
-    }
-    
-    df["gender"] = df["gender"].map(gender_map)
-    
-    counts = df["gender"].value_counts(dropna=False)
-    print(f"Gender standardization complete:\n{counts}\n")
+    # labels outside the two canonical categories (including empty
+    # strings and None) become NaN
+    gender = df["gender"].astype("string").str.strip().replace(GENDER_MAP)
+    gender = gender.where(gender.isin(GENDER_CATEGORIES))
+    df["gender"] = gender.astype(pd.CategoricalDtype(GENDER_CATEGORIES))
+    
+    if verbose:
+        counts = df["gender"].value_counts(dropna=False)
+        logger.info("Gender standardization complete:\n%s\n", counts)
     return df
 
 
-def normalize_dates(df: pd.DataFrame) -> pd.DataFrame:
+def _downcast(series: pd.Series) -> pd.Series:
+    """
+    Shrink a numeric column to the narrowest dtype that holds its values.
+    
+    Whole-number columns become the smallest integer type; anything that
+    can't be an integer (fractions or NaN) becomes float32.
+    """
+    series = pd.to_numeric(series, downcast="integer")
+    if pd.api.types.is_float_dtype(series):
+        series = pd.to_numeric(series, downcast="float")
+    return series
+
+
+def _dates_from_parts(day: np.ndarray, month: np.ndarray, year: np.ndarray) -> np.ndarray:
+    """
+    Build datetime64[D] values from integer day/month/year arrays.
+    
+    Works directly on numpy buffers so the DD/MM vs MM/DD decision
+    doesn't need a second string parse. Combinations that are not a
+    real calendar date (e.g. 31/02) come back as NaT.
+    """
+    out = np.full(len(day), np.datetime64("NaT"), dtype="datetime64[D]")
+    ok = (month >= 1) & (month <= 12) & (day >= 1) & (year >= 1)
+    month_start = ((year[ok] - 1970) * 12 + month[ok] - 1).astype("datetime64[M]")
+    first_day = month_start.astype("datetime64[D]")
+    month_len = ((month_start + 1).astype("datetime64[D]") - first_day).astype("int64")
+    in_month = day[ok] <= month_len
+    
+    valid_idx = np.flatnonzero(ok)[in_month]
+    out[valid_idx] = first_day[in_month] + (day[ok][in_month] - 1)
+    return out
+
+
+def normalize_dates(df: pd.DataFrame, verbose: bool = False) -> pd.DataFrame:
     """
     Normalize date_of_birth to a consistent datetime format.
     
@@ -66,68 +174,43 @@ def normalize_dates(df: pd.DataFrame) -> pd.DataFrame:
     (YYYY-MM-DD, DD/MM/YYYY, YYYY/MM/DD, MM/DD/YYYY). When the
     format is ambiguous (both parts <= 12), defaults to DD/MM/YYYY.
     """
-    def parse_dob(val):
-        if pd.isna(val) or val == "" or val == "None":
-            return pd.NaT
-        val = str(val).strip()
-        if not val:
-            return pd.NaT
-        
-        # ISO format: YYYY-MM-DD
-        if "-" in val:
-            try:
-                return pd.to_datetime(val, format="%Y-%m-%d")
-            except (ValueError, TypeError):
-                return pd.NaT
-        
-        # slash-based formats
-        if "/" in val:
-            parts = val.split("/")
-            if len(parts) != 3:
-                return pd.NaT
-            
-            # YYYY/MM/DD — first part is 4 digits (year)
-            if len(parts[0]) == 4:
-                try:
-                    return pd.to_datetime(val, format="%Y/%m/%d")
-                except (ValueError, TypeError):
-                    return pd.NaT
-            
-            # now it's either DD/MM/YYYY or MM/DD/YYYY
-            first, second = int(parts[0]), int(parts[1])
-            
-            # if first > 12, it must be DD (can't be a month)
-            if first > 12:
-                try:
-                    return pd.to_datetime(val, format="%d/%m/%Y")
-                except (ValueError, TypeError):
-                    return pd.NaT
-            
-            # if second > 12, it must be DD, so first is MM
-            if second > 12:
-                try:
-                    return pd.to_datetime(val, format="%m/%d/%Y")
-                except (ValueError, TypeError):
-                    return pd.NaT
-            
-            # ambiguous case: both <= 12
-            # default to DD/MM/YYYY (more common in the dataset)
-            try:
-                return pd.to_datetime(val, format="%d/%m/%Y")
-            except (ValueError, TypeError):
-                return pd.NaT
-        
-        return pd.NaT
-
-    df["date_of_birth"] = df["date_of_birth"].apply(parse_dob)
-    
-    valid = df["date_of_birth"].notna().sum()
-    missing = df["date_of_birth"].isna().sum()
-    print(f"Date normalization: {valid} valid, {missing} missing/unparseable")
+    s = df["date_of_birth"].astype("string").str.strip()
+    parsed = pd.Series(pd.NaT, index=df.index, dtype="datetime64[us]")
+
+    # ISO format: YYYY-MM-DD
+    iso = s.str.contains("-", regex=False, na=False)
+    # YYYY/MM/DD — first part is 4 digits (year)
+    ymd = ~iso & s.str.match(r"^\d{4}/", na=False)
+
+    # now it's either DD/MM/YYYY or MM/DD/YYYY; only digits pass, so
+    # the parts convert to int without errors
+    slash = ~iso & ~ymd & s.str.fullmatch(r"[0-9]{1,2}/[0-9]{1,2}/[0-9]{4}", na=False)
+    parts = s[slash].str.split("/")
+    first = parts.str[0].astype(int).to_numpy()
+    second = parts.str[1].astype(int).to_numpy()
+    year = parts.str[2].astype(int).to_numpy()
+
+    # if second > 12 (and first is not), first must be MM;
+    # otherwise (first > 12, or ambiguous) default to DD/MM/YYYY
+    mdy = (first <= 12) & (second > 12)
+    day = np.where(mdy, second, first)
+    month = np.where(mdy, first, second)
+    parsed.loc[parts.index] = _dates_from_parts(day, month, year)
+
+    for mask, fmt in [(iso, "%Y-%m-%d"), (ymd, "%Y/%m/%d")]:
+        if mask.any():
+            parsed.loc[mask] = pd.to_datetime(s[mask], format=fmt, errors="coerce")
+
+    df["date_of_birth"] = parsed
+    
+    if verbose:
+        valid = df["date_of_birth"].notna().sum()
+        missing = len(df) - valid
+        logger.info("Date normalization: %d valid, %d missing/unparseable", valid, missing)
     return df
 
 
-def fix_income_types(df: pd.DataFrame) -> pd.DataFrame:
+def fix_income_types(df: pd.DataFrame, verbose: bool = False) -> pd.DataFrame:
     """
     Coerce annual_income to a numeric type.
     
@@ -137,14 +220,15 @@ def fix_income_types(df: pd.DataFrame) -> pd.DataFrame:
     df["annual_income"] = pd.to_numeric(df["annual_income"], errors="coerce")
     
     # round to whole number since income should be integer
-    df["annual_income"] = df["annual_income"].round(0)
+    df["annual_income"] = _downcast(df["annual_income"].round(0))
     
-    missing = df["annual_income"].isna().sum()
-    print(f"Income type fix: {missing} missing values remain")
+    if verbose:
+        missing = df["annual_income"].isna().sum()
+        logger.info("Income type fix: %d missing values remain", missing)
     return df
 
 
-def fix_invalid_values(df: pd.DataFrame) -> pd.DataFrame:
+def fix_invalid_values(df: pd.DataFrame, verbose: bool = False) -> pd.DataFrame:
     """
     Set impossible values to NaN and flag suspicious ones.
     
@@ -154,81 +238,64 @@ def fix_invalid_values(df: pd.DataFrame) -> pd.DataFrame:
     """
     # negative credit history
     neg_ch = df["credit_history_months"] < 0
-    n_neg_ch = neg_ch.sum()
-    if n_neg_ch > 0:
-        print(f"Found {n_neg_ch} negative credit_history_months -> setting to NaN")
-        df.loc[neg_ch, "credit_history_months"] = np.nan
+    df["credit_history_months"] = df["credit_history_months"].mask(neg_ch)
+    if verbose and neg_ch.any():
+        logger.info("Found %d negative credit_history_months -> setting to NaN", neg_ch.sum())
     
     # negative savings balance
     neg_sb = df["savings_balance"] < 0
-    n_neg_sb = neg_sb.sum()
-    if n_neg_sb > 0:
-        print(f"Found {n_neg_sb} negative savings_balance -> setting to NaN")
-        df.loc[neg_sb, "savings_balance"] = np.nan
+    df["savings_balance"] = df["savings_balance"].mask(neg_sb)
+    if verbose and neg_sb.any():
+        logger.info("Found %d negative savings_balance -> setting to NaN", neg_sb.sum())
+    
+    # store in the narrowest dtype now that negatives are gone
+    for col in ["credit_history_months", "debt_to_income", "savings_balance"]:
+        df[col] = _downcast(df[col])
     
     # flag extreme DTI (> 1.0 means debt payments exceed income)
     high_dti = df["debt_to_income"] > 1.0
-    n_high_dti = high_dti.sum()
-    if n_high_dti > 0:
-        print(f"Found {n_high_dti} records with debt_to_income > 1.0 (flagged)")
     df["high_dti_flag"] = high_dti
+    if verbose and high_dti.any():
+        logger.info("Found %d records with debt_to_income > 1.0 (flagged)", high_dti.sum())
     
     return df
 
 
-def validate_emails(df: pd.DataFrame) -> pd.DataFrame:
+def validate_emails(df: pd.DataFrame, verbose: bool = False) -> pd.DataFrame:
     """
     Flag invalid email addresses with a boolean column.
     
     Uses a regex to check basic email format. We only flag (not correct)
     invalid entries because we can't guess the intended address.
     """
-    email_pattern = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
-    
-    def is_valid_email(val):
-        if pd.isna(val) or val == "":
-            return False
-        return bool(email_pattern.match(str(val)))
+    emails = df["email"].astype("string")
+    df["email_valid"] = emails.str.match(EMAIL_PATTERN, na=False).astype(bool)
     
-    df["email_valid"] = df["email"].apply(is_valid_email)
-    
-    invalid_count = (~df["email_valid"]).sum()
-    print(f"Email validation: {invalid_count} invalid emails flagged")
+    if verbose:
+        invalid_count = (~df["email_valid"]).sum()
+        logger.info("Email validation: %d invalid emails flagged", invalid_count)
     return df
 
 
-def flag_missing_fields(df: pd.DataFrame) -> pd.DataFrame:
+def flag_missing_fields(df: pd.DataFrame, verbose: bool = False) -> pd.DataFrame:
     """
     Create a completeness score for each record.
     Core fields that should be present: app_id, full_name, email, ssn, 
     ip_address, gender, date_of_birth, zip_code, annual_income, 
     credit_history_months, debt_to_income, savings_balance, loan_approved
     """
-    core_fields = [
-        "full_name", "email", "ssn", "ip_address", "gender",
-        "date_of_birth", "zip_code", "annual_income",
-        "credit_history_months", "debt_to_income", "savings_balance",
-        "loan_approved"
-    ]
-    
     # count how many core fields are non-null and non-empty
-    def count_complete(row):
-        complete = 0
-        for field in core_fields:
-            val = row.get(field)
-            if pd.notna(val) and val != "":
-                complete += 1
-        return complete
-    
-    df["completeness_score"] = df.apply(count_complete, axis=1)
-    df["completeness_pct"] = (df["completeness_score"] / len(core_fields) * 100).round(1)
-    
-    incomplete = (df["completeness_pct"] < 100).sum()
-    print(f"Completeness: {incomplete} records have missing core fields")
+    sub = df.reindex(columns=CORE_FIELDS)
+    df["completeness_score"] = (sub.notna() & sub.ne("")).sum(axis=1).astype("int8")
+    df["completeness_pct"] = (df["completeness_score"] / len(CORE_FIELDS) * 100).round(1)
+    
+    if verbose:
+        incomplete = (df["completeness_pct"] < 100).sum()
+        logger.info("Completeness: %d records have missing core fields", incomplete)
     return df
 
 
-def flag_ssn_duplicates(df: pd.DataFrame) -> pd.DataFrame:
+def flag_ssn_duplicates(df: pd.DataFrame, verbose: bool = False) -> pd.DataFrame:
     """
     Flag SSNs that appear on more than one record.
     
@@ -236,47 +303,155 @@ def flag_ssn_duplicates(df: pd.DataFrame) -> pd.DataFrame:
     where different applicants were assigned the same SSN.
     """
     # only check non-null SSNs
-    ssn_valid = df[df["ssn"].notna() & (df["ssn"] != "")]
-    ssn_counts = ssn_valid["ssn"].value_counts()
-    dup_ssns = ssn_counts[ssn_counts > 1].index.tolist()
-    
-    df["ssn_duplicate_flag"] = df["ssn"].isin(dup_ssns)
+    ssn = df["ssn"]
+    ssn_valid = ssn.notna() & ssn.ne("")
+    df["ssn_duplicate_flag"] = (ssn.duplicated(keep=False) & ssn_valid).to_numpy()
     
-    if dup_ssns:
-        print(f"Flagged {len(dup_ssns)} SSNs appearing on multiple different applicants")
+    if verbose:
+        n_dup_ssns = ssn[df["ssn_duplicate_flag"]].nunique()
+        if n_dup_ssns:
+            logger.info("Flagged %d SSNs appearing on multiple different applicants", n_dup_ssns)
     return df
 
 
-def clean_pipeline(df: pd.DataFrame) -> pd.DataFrame:
+def clean_pipeline(
+    df: pd.DataFrame, verbose: bool = False, seen_ids: set | None = None
+) -> pd.DataFrame:
     """
     Run the full cleaning pipeline in order.
-    Each step prints what it did so we have a log.
+    With verbose=True each step logs what it did (at INFO level) so we
+    have a log; otherwise the diagnostic counts are skipped entirely.
+    seen_ids is passed on to remove_duplicates when cleaning chunk by
+    chunk.
     """
-    print("=" * 50)
-    print("STARTING DATA CLEANING PIPELINE")
-    print("=" * 50)
-    
-    df = remove_duplicates(df)
-    df = standardize_gender(df)
-    df = normalize_dates(df)
-    df = fix_income_types(df)
-    df = fix_invalid_values(df)
-    df = validate_emails(df)
-    df = flag_missing_fields(df)
-    df = flag_ssn_duplicates(df)
-    
-    print("=" * 50)
-    print(f"CLEANING COMPLETE — {len(df)} records")
-    print("=" * 50)
+    if verbose:
+        logger.info("=" * 50)
+        logger.info("STARTING DATA CLEANING PIPELINE")
+        logger.info("=" * 50)
+    
+    df = remove_duplicates(df, verbose, seen_ids)
+    df = standardize_gender(df, verbose)
+    df = normalize_dates(df, verbose)
+    df = fix_income_types(df, verbose)
+    df = fix_invalid_values(df, verbose)
+    df = validate_emails(df, verbose)
+    df = flag_missing_fields(df, verbose)
+    df = flag_ssn_duplicates(df, verbose)
+    
+    if verbose:
+        logger.info("=" * 50)
+        logger.info("CLEANING COMPLETE — %d records", len(df))
+        logger.info("=" * 50)
     return df
 
 
+def _to_arrow_table(df: pd.DataFrame) -> "pa.Table":
+    """
+    Convert a cleaned DataFrame to an Arrow table for writing to Parquet.
+    
+    The pandas schema metadata is dropped because pandas can't rebuild the
+    Arrow list dtype of spending_categories_arr from it, which makes
+    pd.read_parquet fail on the file. Column types then come from the Arrow
+    schema alone.
+    """
+    return pa.Table.from_pandas(df, preserve_index=False).replace_schema_metadata()
+
+
+def _flag_ssn_duplicates_in_file(path: str) -> None:
+    """
+    Recompute ssn_duplicate_flag over a whole Parquet file.
+    
+    Each chunk only sees its own SSNs, so repeats that span chunks are
+    missed. This reads just the ssn column to find every repeated SSN and,
+    if any flags change, rewrites the file one row group at a time.
+    """
+    table = pq.read_table(path, columns=["ssn", "ssn_duplicate_flag"])
+    counts = pc.value_counts(table["ssn"]).flatten()
+    dup_ssns = pc.filter(counts[0], pc.greater(counts[1], 1))
+    dup_ssns = pc.filter(dup_ssns, pc.not_equal(dup_ssns, ""))
+    
+    # chunk-level flags are a subset of the global ones, so equal
+    # counts mean nothing changed
+    n_flagged = pc.sum(pc.is_in(table["ssn"], value_set=dup_ssns)).as_py() or 0
+    if n_flagged == (pc.sum(table["ssn_duplicate_flag"]).as_py() or 0):
+        return
+    
+    tmp_path = path + ".tmp"
+    source = pq.ParquetFile(path)
+    with pq.ParquetWriter(tmp_path, source.schema_arrow) as writer:
+        for i in range(source.num_row_groups):
+            group = source.read_row_group(i)
+            flag = pc.fill_null(pc.is_in(group["ssn"], value_set=dup_ssns), False)
+            idx = group.schema.get_field_index("ssn_duplicate_flag")
+            writer.write_table(group.set_column(idx, "ssn_duplicate_flag", flag))
+    os.replace(tmp_path, path)
+
+
+def clean_in_chunks(
+    filepath: str, out_path: str, chunk_rows: int | None = None, verbose: bool = False
+) -> int:
+    """
+    Stream the raw JSON through clean_pipeline chunk by chunk and append
+    each cleaned chunk to a Parquet file, so peak memory is bounded by the
+    chunk size instead of the dataset size. Returns the number of records
+    written.
+    
+    app_id deduplication carries the IDs kept so far from chunk to chunk.
+    SSN repeats can span chunks, so ssn_duplicate_flag is recomputed over
+    the written file at the end. chunk_rows defaults to
+    data_loader.CHUNK_ROWS.
+    """
+    from data_loader import CHUNK_ROWS, iter_flattened_chunks
+    
+    if pa is None:
+        raise ImportError("clean_in_chunks needs pyarrow to write Parquet")
+    if chunk_rows is None:
+        chunk_rows = CHUNK_ROWS
+    
+    seen_ids = set()
+    writer = None
+    n_records = 0
+    try:
+        for chunk in iter_flattened_chunks(filepath, chunk_rows):
+            chunk = clean_pipeline(chunk, verbose, seen_ids)
+            table = _to_arrow_table(chunk.astype(PARQUET_DTYPES))
+            if writer is None:
+                writer = pq.ParquetWriter(out_path, table.schema)
+            writer.write_table(table.cast(writer.schema))
+            n_records += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+    
+    if writer is not None:
+        _flag_ssn_duplicates_in_file(out_path)
+    logger.info("Wrote %d cleaned records to %s", n_records, out_path)
+    return n_records
+
+
 if __name__ == "__main__":
     from data_loader import load_and_flatten
     
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     df = load_and_flatten("data/raw_credit_applications.json")
-    df_clean = clean_pipeline(df)
+    df_clean = clean_pipeline(df, verbose=True)
+    
+    # save cleaned data as snappy Parquet: columnar, keeps the dtypes and
+    # is much faster to write and read than CSV
+    if pa is not None:
+        pq.write_table(
+            _to_arrow_table(df_clean),
+            "data/cleaned_credit_applications.parquet",
+            compression="snappy",
+        )
+        logger.info("Saved cleaned data to data/cleaned_credit_applications.parquet")
+    else:
+        logger.warning("pyarrow is not installed, skipping the Parquet output")
     
-    # save cleaned data
-    df_clean.to_csv("data/cleaned_credit_applications.csv", index=False)
-    print("\nSaved cleaned data to data/cleaned_credit_applications.csv")
+    # notebooks 02 and 03 still read the CSV export; CSV has no list type,
+    # so the categories go out only as the "|"-joined spending_category_list
+    df_clean.drop(columns="spending_categories_arr").to_csv(
+        "data/cleaned_credit_applications.csv", index=False
+    )
+    logger.info("Saved cleaned data to data/cleaned_credit_applications.csv")
@@ -4,69 +4,176 @@ structure into a pandas DataFrame that the rest of the team can work with.
 """
 
 import json
+import logging
+from itertools import islice
 import pandas as pd
 
+# orjson is a much faster C parser; fall back to the stdlib if it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ijson parses records one at a time, so chunked loading doesn't need
+# the whole file in memory
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# with pyarrow the spending categories are kept as an Arrow list column
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+
+logger = logging.getLogger(__name__)
+
+# number of records per chunk when streaming the raw file
+CHUNK_ROWS = 200_000
+
+# final column order of the flattened DataFrame
+COLUMNS = [
+    "app_id", "full_name", "email", "ssn", "ip_address", "gender",
+    "date_of_birth", "zip_code", "annual_income", "credit_history_months",
+    "debt_to_income", "savings_balance", "spending_total",
+    "spending_categories", "spending_category_list",
+    "spending_categories_arr", "loan_approved",
+    "interest_rate", "approved_amount", "rejection_reason",
+    "processing_timestamp", "loan_purpose", "notes",
+]
+
+# fields produced by flatten_record; the two category columns are added
+# afterwards by spending_category_columns
+RECORD_COLUMNS = [
+    col for col in COLUMNS
+    if col not in ("spending_category_list", "spending_categories_arr")
+]
+
+# low-cardinality text columns, stored as categoricals to save memory
+CATEGORICAL_COLUMNS = ["rejection_reason", "loan_purpose", "notes"]
+
 
 def load_raw_json(filepath: str) -> list:
     """Load the raw JSON file and return the list of records."""
-    with open(filepath, "r") as f:
-        data = json.load(f)
-    print(f"Loaded {len(data)} records from {filepath}")
+    if orjson is not None:
+        with open(filepath, "rb") as f:
+            data = orjson.loads(f.read())
+    else:
+        with open(filepath, "r") as f:
+            data = json.load(f)
+    logger.info("Loaded %d records from %s", len(data), filepath)
     return data
 
 
-def flatten_record(record: dict) -> dict:
+def iter_raw_chunks(filepath: str, chunk_rows: int = CHUNK_ROWS):
     """
-    Take a single nested JSON record and flatten it into a flat dictionary.
+    Yield the raw records in lists of at most chunk_rows.
     
-    The raw data has nested objects for applicant_info, financials, and decision,
-    plus spending_behavior as an array. We flatten the nested objects into
-    prefixed columns and aggregate spending_behavior into total + categories.
+    With ijson installed the file is streamed, so only one chunk of
+    records is held in memory at a time. Otherwise the whole file is
+    loaded and sliced.
     """
-    flat = {}
+    if ijson is None:
+        data = load_raw_json(filepath)
+        for start in range(0, len(data), chunk_rows):
+            yield data[start:start + chunk_rows]
+        return
+
+    with open(filepath, "rb") as f:
+        records = ijson.items(f, "item", use_float=True)
+        while chunk := list(islice(records, chunk_rows)):
+            yield chunk
 
-    # top-level fields
-    flat["app_id"] = record.get("_id")
 
-    # applicant_info fields
+def flatten_record(record: dict) -> tuple:
+    """
+    Take a single nested JSON record and flatten it into a tuple of
+    values in RECORD_COLUMNS order.
+    
+    The raw data has nested objects for applicant_info, financials, and decision,
+    plus spending_behavior as an array. We flatten the nested objects into
+    columns and aggregate spending_behavior into total + count; the category
+    columns are built for all records at once by spending_category_columns.
+    A tuple is much cheaper to build than a dict, and DataFrame.from_records
+    takes the column names from RECORD_COLUMNS instead of hashing keys per
+    record.
+    """
     app_info = record.get("applicant_info", {})
-    flat["full_name"] = app_info.get("full_name")
-    flat["email"] = app_info.get("email")
-    flat["ssn"] = app_info.get("ssn")
-    flat["ip_address"] = app_info.get("ip_address")
-    flat["gender"] = app_info.get("gender")
-    flat["date_of_birth"] = app_info.get("date_of_birth")
-    flat["zip_code"] = app_info.get("zip_code")
-
-    # financials
     fin = record.get("financials", {})
-    # some records use 'annual_salary' instead of 'annual_income'
-    flat["annual_income"] = fin.get("annual_income") if fin.get("annual_income") is not None else fin.get("annual_salary")
-    flat["credit_history_months"] = fin.get("credit_history_months")
-    flat["debt_to_income"] = fin.get("debt_to_income")
-    flat["savings_balance"] = fin.get("savings_balance")
-
-    # spending behavior — flatten the array
+    dec = record.get("decision", {})
     spending = record.get("spending_behavior", [])
-    flat["spending_total"] = sum(item.get("amount", 0) for item in spending)
-    flat["spending_categories"] = len(spending)
+
+    # some records use 'annual_salary' instead of 'annual_income'
+    annual_income = fin.get("annual_income")
+    if annual_income is None:
+        annual_income = fin.get("annual_salary")
+
+    return (
+        record.get("_id"),
+        app_info.get("full_name"),
+        app_info.get("email"),
+        app_info.get("ssn"),
+        app_info.get("ip_address"),
+        app_info.get("gender"),
+        app_info.get("date_of_birth"),
+        app_info.get("zip_code"),
+        annual_income,
+        fin.get("credit_history_months"),
+        fin.get("debt_to_income"),
+        fin.get("savings_balance"),
+        sum(item.get("amount", 0) for item in spending),
+        len(spending),
+        dec.get("loan_approved"),
+        dec.get("interest_rate"),
+        dec.get("approved_amount"),
+        dec.get("rejection_reason"),
+        record.get("processing_timestamp"),
+        record.get("loan_purpose"),
+        record.get("notes"),
+    )
+
+
+def spending_category_columns(raw_data: list) -> tuple:
+    """
+    Collect each record's spending categories and return them both as a
+    list column and as "|"-joined strings.
+    
+    With pyarrow the per-record lists become one Arrow list<string> array,
+    and Arrow's binary_join kernel derives the joined strings from it in a
+    single pass instead of a Python join per record. Without pyarrow the
+    list column holds plain Python lists.
+    """
     # store individual categories so we can analyze them later
-    categories = [item.get("category", "") for item in spending]
-    flat["spending_category_list"] = "|".join(categories)
+    categories = [
+        [item.get("category", "") for item in record.get("spending_behavior", [])]
+        for record in raw_data
+    ]
+    if pa is None:
+        return categories, ["|".join(cats) for cats in categories]
 
-    # decision
-    dec = record.get("decision", {})
-    flat["loan_approved"] = dec.get("loan_approved")
-    flat["interest_rate"] = dec.get("interest_rate")
-    flat["approved_amount"] = dec.get("approved_amount")
-    flat["rejection_reason"] = dec.get("rejection_reason")
+    lists = pa.array(categories, type=pa.list_(pa.string()))
+    joined = pc.binary_join(lists, "|").to_numpy(zero_copy_only=False)
+    return pd.array(lists, dtype=pd.ArrowDtype(lists.type)), joined
 
-    # extra fields that appear inconsistently
-    flat["processing_timestamp"] = record.get("processing_timestamp")
-    flat["loan_purpose"] = record.get("loan_purpose")
-    flat["notes"] = record.get("notes")
 
-    return flat
+def flatten_records(raw_data: list) -> pd.DataFrame:
+    """
+    Flatten a list of raw records into a DataFrame.
+    
+    The categories are kept both as a list column (spending_categories_arr)
+    and as a "|"-joined string (spending_category_list).
+    """
+    df = pd.DataFrame.from_records(
+        map(flatten_record, raw_data), columns=RECORD_COLUMNS, nrows=len(raw_data)
+    )
+
+    lists, joined = spending_category_columns(raw_data)
+    df.insert(COLUMNS.index("spending_category_list"), "spending_category_list", joined)
+    df.insert(COLUMNS.index("spending_categories_arr"), "spending_categories_arr", lists)
+    df = df.astype({col: "category" for col in CATEGORICAL_COLUMNS})
+    return df
 
 
 def load_and_flatten(filepath: str) -> pd.DataFrame:
@@ -74,15 +181,23 @@ def load_and_flatten(filepath: str) -> pd.DataFrame:
     Main entry point: loads raw JSON and returns a flattened DataFrame.
     This is the function that the notebooks should call.
     """
-    raw_data = load_raw_json(filepath)
-    flat_records = [flatten_record(r) for r in raw_data]
-    df = pd.DataFrame(flat_records)
-    print(f"DataFrame shape: {df.shape}")
+    df = flatten_records(load_raw_json(filepath))
+    logger.info("DataFrame shape: %s", df.shape)
     return df
 
 
+def iter_flattened_chunks(filepath: str, chunk_rows: int = CHUNK_ROWS):
+    """
+    Chunked version of load_and_flatten: yields one flattened DataFrame
+    per chunk of at most chunk_rows raw records.
+    """
+    for chunk in iter_raw_chunks(filepath, chunk_rows):
+        yield flatten_records(chunk)
+
+
 if __name__ == "__main__":
     # quick test
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     df = load_and_flatten("data/raw_credit_applications.json")
     print(df.head())
     print(df.dtypes)